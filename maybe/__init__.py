@@ -11,6 +11,7 @@
 from sys import _getframe
 from collections import OrderedDict
 
+from six.moves import intern
 from blessings import Terminal
 
 
@@ -45,4 +46,9 @@ def register_filter(syscall, filter_function, filter_scope=None):
         filter_scope = caller_module.split(".")[-1]
     if filter_scope not in SYSCALL_FILTERS:
         SYSCALL_FILTERS[filter_scope] = {}
+    # Syscall names are looked up in the filter dictionary on every syscall,
+    # and interned keys allow those lookups to match by identity
+    # (Python 2's intern only accepts byte strings)
+    if isinstance(syscall, str):
+        syscall = intern(syscall)
     SYSCALL_FILTERS[filter_scope][syscall] = filter_function
@@ -14,16 +14,34 @@ from grp import getgrgid
 from maybe import T, register_filter
 
 
+# Name lookups can go through NSS (and thus LDAP etc.), so they are cached
+# for the lifetime of maybe (functools.lru_cache is not available on Python 2)
+user_names = {}
+group_names = {}
+
+
+def get_user_name(uid):
+    if uid not in user_names:
+        user_names[uid] = getpwuid(uid)[0]
+    return user_names[uid]
+
+
+def get_group_name(gid):
+    if gid not in group_names:
+        group_names[gid] = getgrgid(gid)[0]
+    return group_names[gid]
+
+
 def filter_change_owner(path, owner, group):
     if owner == -1:
         label = "change group"
-        owner = getgrgid(group)[0]
+        owner = get_group_name(group)
     elif group == -1:
         label = "change owner"
-        owner = getpwuid(owner)[0]
+        owner = get_user_name(owner)
     else:
         label = "change owner"
-        owner = getpwuid(owner)[0] + ":" + getgrgid(group)[0]
+        owner = get_user_name(owner) + ":" + get_group_name(group)
     return "%s of %s to %s" % (T.yellow(label), T.underline(path), T.bold(owner)), 0
 
 
@@ -11,13 +11,14 @@
 from maybe import T, register_filter
 
 
+# Permission bits in the order in which "ls -l" displays them
+permission_bits = [(0o400, "r"), (0o200, "w"), (0o100, "x"),
+                   (0o040, "r"), (0o020, "w"), (0o010, "x"),
+                   (0o004, "r"), (0o002, "w"), (0o001, "x")]
+
+
 def format_permissions(permissions):
-    result = ""
-    for i in range(2, -1, -1):
-        result += "r" if permissions & (4 * 8**i) else "-"
-        result += "w" if permissions & (2 * 8**i) else "-"
-        result += "x" if permissions & (1 * 8**i) else "-"
-    return result
+    return "".join([character if permissions & bit else "-" for bit, character in permission_bits])
 
 
 def filter_change_permissions(path, permissions):
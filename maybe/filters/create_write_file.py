@@ -8,26 +8,45 @@
 # (https://gnu.org/licenses/gpl.html)
 
 
-from os.path import exists
+from os.path import exists, lexists
 from os import O_WRONLY, O_RDWR, O_APPEND, O_CREAT, O_TRUNC
 from stat import S_IFCHR, S_IFBLK, S_IFIFO, S_IFSOCK
 
+from ptrace.syscall.posix_arg import AT_FDCWD
+
 from maybe import T, register_filter
 
 
-allowed_files = set(["/dev/null", "/dev/zero", "/dev/tty"])
+allowed_files = frozenset(["/dev/null", "/dev/zero", "/dev/tty"])
+
+# creat(2): "A call to creat() is equivalent to calling open() with flags equal to O_CREAT|O_WRONLY|O_TRUNC"
+creat_flags = O_CREAT | O_WRONLY | O_TRUNC
 
+# Flags that allow the file to be written to through the returned descriptor
+write_flags = O_WRONLY | O_RDWR | O_APPEND
+# Flags that modify the file system as part of the open call itself
+modify_flags = O_CREAT | O_TRUNC
+# Flags for which the open call needs to be inspected at all
+tracked_flags = write_flags | modify_flags
 
-def filter_open(process, path, flags):
+
+def filter_open(process, path, flags, directory_descriptor=AT_FDCWD):
+    if not (flags & tracked_flags):
+        # Plain read access can neither modify the file nor require tracking,
+        # so the (comparatively expensive) path resolution is skipped entirely
+        return None, None
+    path = process.full_path(path, directory_descriptor)
     if path in allowed_files:
         return None, None
-    if (flags & O_CREAT) and not exists(path):
+    # Only stat the file if the flags make its existence relevant, and only once
+    file_exists = (flags & modify_flags) and exists(path)
+    if (flags & O_CREAT) and not file_exists:
         operation = "%s %s" % (T.cyan("create file"), T.underline(path))
-    elif (flags & O_TRUNC) and exists(path):
+    elif (flags & O_TRUNC) and file_exists:
         operation = "%s %s" % (T.red("truncate file"), T.underline(path))
     else:
         operation = None
-    if (flags & O_WRONLY) or (flags & O_RDWR) or (flags & O_APPEND) or (operation is not None):
+    if (flags & write_flags) or (operation is not None):
         # File might be written to later, so we need to track the file descriptor
         return_value = process.register_path(path)
     else:
@@ -36,7 +55,9 @@ def filter_open(process, path, flags):
 
 
 def filter_mknod(path, type):
-    if exists(path):
+    # mknod does not follow symbolic links (it fails with EEXIST even if the link is dangling),
+    # so the path itself is checked without resolving it
+    if lexists(path):
         return None, None
     elif (type & S_IFCHR):
         label = "create character special file"
@@ -52,37 +73,47 @@ def filter_mknod(path, type):
     return "%s %s" % (T.cyan(label), T.underline(path)), 0
 
 
-def filter_write(process, file_descriptor, byte_count):
-    if process.is_tracked_descriptor(file_descriptor):
-        path = process.descriptor_path(file_descriptor)
-        return "%s %s to %s" % (T.red("write"), T.bold("%d bytes" % byte_count), T.underline(path)), byte_count
+def filter_write(process, args):
+    file_descriptor, byte_count = args[0], args[2]
+    path = process.tracked_path(file_descriptor)
+    if path is not None:
+        # Writes are by far the most frequent operation, so the description
+        # is assembled with a single join instead of a format string
+        return " ".join((T.red("write"), T.bold("%d bytes" % byte_count), "to", T.underline(path))), byte_count
     else:
         return None, None
 
 
-def filter_dup(process, file_descriptor_old, file_descriptor_new=None):
-    if process.is_tracked_descriptor(file_descriptor_old):
+def filter_dup(process, args):
+    # Duplicating an untracked descriptor (by far the most common case,
+    # e.g. shell redirections) is decided with a single lookup
+    path = process.tracked_path(args[0])
+    if path is not None:
+        # dup allocates the new descriptor itself, while dup2 and dup3 specify it
+        file_descriptor_new = args[1] if len(args) > 1 else None
         # Copy tracked file descriptor
-        return None, process.register_path(process.descriptor_path(file_descriptor_old), file_descriptor_new)
+        return None, process.register_path(path, file_descriptor_new)
     else:
         return None, None
 
 
 register_filter("open", lambda process, args:
-                filter_open(process, process.full_path(args[0]), args[1]))
+                filter_open(process, args[0], args[1]))
 register_filter("creat", lambda process, args:
-                filter_open(process, process.full_path(args[0]), O_CREAT | O_WRONLY | O_TRUNC))
+                filter_open(process, args[0], creat_flags))
 register_filter("openat", lambda process, args:
-                filter_open(process, process.full_path(args[1], args[0]), args[2]))
+                filter_open(process, args[1], args[2], args[0]))
 register_filter("mknod", lambda process, args:
                 filter_mknod(process.full_path(args[0]), args[1]))
 register_filter("mknodat", lambda process, args:
                 filter_mknod(process.full_path(args[1], args[0]), args[2]))
-register_filter("write", lambda process, args: filter_write(process, args[0], args[2]))
-register_filter("pwrite", lambda process, args: filter_write(process, args[0], args[2]))
+# The write and dup filters take the raw arguments directly,
+# saving a lambda call on these very frequent syscalls
+register_filter("write", filter_write)
+register_filter("pwrite", filter_write)
 # TODO: Actual byte count is iovcnt * iov.iov_len
-register_filter("writev", lambda process, args: filter_write(process, args[0], args[2]))
-register_filter("pwritev", lambda process, args: filter_write(process, args[0], args[2]))
-register_filter("dup", lambda process, args: filter_dup(process, args[0]))
-register_filter("dup2", lambda process, args: filter_dup(process, args[0], args[1]))
-register_filter("dup3", lambda process, args: filter_dup(process, args[0], args[1]))
+register_filter("writev", filter_write)
+register_filter("pwritev", filter_write)
+register_filter("dup", filter_dup)
+register_filter("dup2", filter_dup)
+register_filter("dup3", filter_dup)
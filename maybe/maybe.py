@@ -17,6 +17,11 @@ from ast import literal_eval
 from argparse import ArgumentParser
 from logging import getLogger, NullHandler
 from os.path import splitext, basename
+try:
+    from collections.abc import Sequence
+except ImportError:
+    # Python 2
+    from collections import Sequence
 
 from six import PY2
 from six.moves import input
@@ -46,6 +51,30 @@ def parse_argument(argument):
     return argument
 
 
+# Syscall arguments are only parsed when a filter actually accesses them. In particular,
+# this avoids reading and decoding the data buffer of every write the filters look at,
+# although only the file descriptor is needed to know that most of them are untracked.
+class SyscallArguments(Sequence):
+    def __init__(self, arguments):
+        self._arguments = arguments
+        self._values = {}
+
+    def __len__(self):
+        return len(self._arguments)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            # Normalize negative indices so each argument is cached (and parsed) only once
+            index += len(self._arguments)
+        if not 0 <= index < len(self._arguments):
+            raise IndexError("syscall argument index out of range")
+        if index not in self._values:
+            self._values[index] = parse_argument(self._arguments[index])
+        return self._values[index]
+
+
 def get_operations(debugger, syscall_filters, verbose):
     format_options = FunctionCallOptions(
         replace_socketcall=False,
@@ -55,6 +84,11 @@ def get_operations(debugger, syscall_filters, verbose):
     processes = {}
     operations = []
 
+    # This loop runs for every single syscall made by the traced processes,
+    # so bound methods used in every iteration are looked up only once
+    wait_syscall = debugger.waitSyscall
+    get_filter = syscall_filters.get
+
     while True:
         if not debugger:
             # All processes have exited
@@ -62,7 +96,7 @@ def get_operations(debugger, syscall_filters, verbose):
 
         # This logic is mostly based on python-ptrace's "strace" example
         try:
-            syscall_event = debugger.waitSyscall()
+            syscall_event = wait_syscall()
         except ProcessSignal as event:
             event.process.syscall(event.signum)
             continue
@@ -83,18 +117,19 @@ def get_operations(debugger, syscall_filters, verbose):
 
         if syscall and syscall_state.next_event == "exit":
             # Syscall is about to be executed (just switched from "enter" to "exit")
-            if syscall.name in syscall_filters:
+            filter_function = get_filter(syscall.name)
+            if filter_function is not None:
                 if verbose == 1:
                     print(syscall.format())
                 elif verbose == 2:
                     print(T.bold(syscall.format()))
 
-                filter_function = syscall_filters[syscall.name]
-                if process.pid not in processes:
-                    processes[process.pid] = Process(process)
-                arguments = [parse_argument(argument) for argument in syscall.arguments]
+                filter_process = processes.get(process.pid)
+                if filter_process is None:
+                    filter_process = processes[process.pid] = Process(process)
+                arguments = SyscallArguments(syscall.arguments)
 
-                operation, return_value = filter_function(processes[process.pid], arguments)
+                operation, return_value = filter_function(filter_process, arguments)
 
                 if operation is not None:
                     operations.append(operation)
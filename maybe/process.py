@@ -9,6 +9,7 @@
 
 
 from os import readlink
+from itertools import count
 from os.path import normpath, join
 
 from ptrace.syscall.posix_arg import AT_FDCWD
@@ -17,32 +18,40 @@ from ptrace.syscall.posix_arg import AT_FDCWD
 class Process(object):
     def __init__(self, ptrace_process):
         self._process = ptrace_process
+        # The PID never changes, so the /proc paths used for path resolution
+        # are formatted once instead of on every filtered syscall
+        self._cwd_link = "/proc/%d/cwd" % ptrace_process.pid
+        self._descriptor_link_prefix = "/proc/%d/fd/" % ptrace_process.pid
         # Start with a large number to avoid collisions with other FDs
-        self._next_file_descriptor = 1000000
+        self._file_descriptor_counter = count(1000000)
         self._file_descriptors = {}
 
     def register_path(self, path, file_descriptor=None):
         if file_descriptor is None:
-            file_descriptor = self._next_file_descriptor
-            self._next_file_descriptor += 1
-        self._file_descriptors[file_descriptor] = path
+            file_descriptor = next(self._file_descriptor_counter)
+        # Paths are normalized once here rather than on every lookup
+        self._file_descriptors[file_descriptor] = normpath(path)
         return file_descriptor
 
     def is_tracked_descriptor(self, file_descriptor):
         return file_descriptor in self._file_descriptors
 
+    # Returns the path of a tracked file descriptor, or None if it is not tracked.
+    # Requires only a single lookup, unlike is_tracked_descriptor + descriptor_path.
+    def tracked_path(self, file_descriptor):
+        return self._file_descriptors.get(file_descriptor)
+
     def descriptor_path(self, file_descriptor):
-        if file_descriptor in self._file_descriptors:
-            path = self._file_descriptors[file_descriptor]
-        else:
-            path = readlink("/proc/%d/fd/%d" % (self._process.pid, file_descriptor))
-        return normpath(path)
+        path = self._file_descriptors.get(file_descriptor)
+        if path is None:
+            path = normpath(readlink(self._descriptor_link_prefix + str(file_descriptor)))
+        return path
 
     # Implements the path resolution logic of the "*at" syscalls
     def full_path(self, path, directory_descriptor=AT_FDCWD):
         if directory_descriptor == AT_FDCWD:
             # Current working directory
-            directory = readlink("/proc/%d/cwd" % self._process.pid)
+            directory = readlink(self._cwd_link)
         else:
             # Directory referred to by directory_descriptor
             directory = self.descriptor_path(directory_descriptor)
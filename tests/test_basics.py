@@ -1,7 +1,9 @@
+from pytest import raises
 from ptrace.syscall import SYSCALL_PROTOTYPES
 
 from common import maybe
 from maybe import SYSCALL_FILTERS
+from maybe.maybe import SyscallArguments
 
 
 def test_syscall_filters():
@@ -13,3 +15,33 @@ def test_syscall_filters():
 
 def test_no_operations():
     assert maybe("true") == "maybe has not detected any file system operations from true."
+
+
+class Argument(object):
+    def __init__(self, text):
+        self.text = text
+        self.parse_count = 0
+
+    def createText(self):
+        self.parse_count += 1
+        return self.text
+
+
+def test_syscall_arguments():
+    raw_arguments = [Argument("3"), Argument("'buffer'"), Argument("6")]
+    arguments = SyscallArguments(raw_arguments)
+    assert len(arguments) == 3
+    assert arguments[0] == 3
+    assert arguments[2] == 6
+    assert arguments[-1] == 6
+    assert raw_arguments[2].parse_count == 1
+    with raises(IndexError):
+        arguments[-4]
+    with raises(IndexError):
+        arguments[3]
+    # Arguments that are never accessed are never parsed
+    assert raw_arguments[1].parse_count == 0
+    assert list(arguments) == [3, "buffer", 6]
+    assert arguments[1:] == ["buffer", 6]
+    assert "buffer" in arguments
+    assert arguments.index(6) == 2
@@ -0,0 +1,55 @@
+import sys
+
+from pytest import mark
+from six import PY2
+
+from common import maybe, tf, working_directory
+
+
+# Python is used to make specific syscalls directly, with bytecode writing disabled
+# to keep it from creating files of its own
+PYTHON = "%s -B -c \"import os; {code}\"" % sys.executable
+MKNOD = PYTHON.format(code="os.mknod('{f}')")
+# Opens the file relative to a descriptor of its directory (openat with an actual dirfd)
+OPENAT_TRUNCATE = PYTHON.format(code="d, n = os.path.split(os.path.abspath('{f}')); " +
+                                     "os.open(n, os.O_WRONLY | os.O_TRUNC, dir_fd=os.open(d, os.O_RDONLY))")
+# Writes through a duplicate of the descriptor returned by open
+DUP_WRITE = PYTHON.format(code="os.dup2(os.open('{f}', os.O_WRONLY | os.O_APPEND), 10); " +
+                               "os.write(10, b'xyz')")
+
+
+def test_truncate_file(tmpdir):
+    tf(tmpdir, "sh -c \": > '{f}'\"", "truncate file {f}",
+       "create_write_file", lambda f: f.read() == "abc")
+
+
+@mark.skipif(PY2, reason="os.open does not support dir_fd on Python 2")
+def test_truncate_file_openat(tmpdir):
+    tf(tmpdir, OPENAT_TRUNCATE, "truncate file {f}",
+       "create_write_file", lambda f: f.read() == "abc")
+
+
+def test_write_file_dup(tmpdir):
+    tf(tmpdir, DUP_WRITE, "write 3 bytes to {f}",
+       "create_write_file", lambda f: f.read() == "abc")
+
+
+def t_mknod(directory, command, label):
+    with working_directory(directory):
+        f = directory.join("node")
+        # Missing path
+        assert maybe("-l -- " + command.format(f="node")) == "%s %s" % (label, f)
+        assert not f.check()
+        # Dangling symbolic link (mknod fails with EEXIST instead of following it)
+        f.mksymlinkto("missing")
+        assert maybe("-l -- " + command.format(f="node")).startswith("maybe has not detected")
+        assert f.check(link=True)
+        assert not directory.join("missing").check()
+
+
+def test_mknod_file(tmpdir):
+    t_mknod(tmpdir, MKNOD, "create file")
+
+
+def test_mkfifo(tmpdir):
+    t_mknod(tmpdir, "mkfifo '{f}'", "create named pipe")